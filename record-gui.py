@@ -9,38 +9,102 @@ import threading
 import queue
 import json
 import time
+import locale
+import functools
+import pathlib
 from datetime import datetime
 from PySide6.QtWidgets import (QApplication, QMainWindow, QFileDialog, QMessageBox, 
                               QInputDialog, QLineEdit, QTableWidgetItem, QLabel, 
                               QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QWidget,
                               QTabWidget, QTextEdit)
 from PySide6.QtUiTools import QUiLoader
-from PySide6.QtCore import QFile, QIODevice, Qt, QSize, QUrl, Signal, QObject
-from PySide6.QtGui import QPixmap, QImage, QIcon, QAction, QDesktopServices
+from PySide6.QtCore import (QIODevice, Qt, QSize, QUrl, Signal, Slot, QObject,
+                            QFileSystemWatcher, QTimer, QBuffer, QByteArray, QProcess,
+                            QSettings)
+from PySide6.QtGui import QPixmap, QImage, QIcon, QAction, QDesktopServices, QTextCursor
 import requests
 from io import BytesIO
 import warnings
 import logging
 
+try:
+    import orjson  # 설치되어 있으면 더 빠른 JSON 파서 사용
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# 이 시간(ms) 동안 녹화 파일이 커지지 않으면 저장이 멈춘 것으로 판단
+FILE_STALL_TIMEOUT_MS = 30000
+
+# 파일명에서 사용할 수 없는 문자
+_FORBIDDEN_RE = re.compile(r'[<>:"/\\|?*]')
+# streamlink 출력의 진행률 (읽은 bytes에 그대로 적용)
+_PROGRESS_RE = re.compile(rb'(\d+)%')
+
+# streamlink 출력 인코딩 (subprocess의 text 모드와 같은 로케일 인코딩)
+_OUTPUT_ENCODING = locale.getpreferredencoding(False)
+
+UI_FILE_NAME = "ui/main_window.ui"
+
+# 로그 창에 유지할 최대 줄 수 (오래된 줄부터 삭제)
+LOG_MAX_BLOCKS = 5000
+
+def format_mb(size_bytes):
+    """바이트 크기를 소수점 둘째 자리까지의 MB 문자열로 변환합니다 (정수 연산만 사용)."""
+    size_mb_x100 = (size_bytes * 100) >> 20
+    return f"{size_mb_x100 // 100}.{size_mb_x100 % 100:02d}"
+
+@functools.lru_cache(maxsize=None)
+def _load_ui_bytes(ui_file_name):
+    """UI 파일 내용을 읽어 캐시합니다. 창을 여러 번 만들어도 파일은 한 번만 읽습니다."""
+    return pathlib.Path(ui_file_name).read_bytes()
+
 class StreamRecorder(QObject):
     status_changed = Signal(str, str)  # (url, status)
-    progress_changed = Signal(str, str)  # (url, progress)
-    metadata_received = Signal(dict)  # 메타데이터
+    progress_changed = Signal(str, int)  # (url, percent)
+    metadata_received = Signal(object, dict)  # (recorder, 메타데이터)
     log_message = Signal(str)  # 로그 메시지
-    size_changed = Signal(str, int)  # (url, size_bytes)
+    _metadata_ready = Signal()  # 작업 스레드 -> GUI 스레드 알림
     
     def __init__(self, url, output_dir, username=None, password=None):
         super().__init__()
         self.url = url
         self.output_dir = output_dir  # 디렉토리만 저장
         self.output_path = None  # 실제 파일 경로는 메타데이터 획득 후 설정
+        self._output_path_bytes = None  # os.stat용으로 미리 인코딩한 경로
         self.username = username
         self.password = password
         self.process = None
+        self._output_buffer = b''
+        self._last_status = None  # 같은 상태/진행률은 다시 보내지 않음
+        self._last_progress = None
         self.is_running = False
+        self._starting = False
+        self._stop_requested = False
         self.status_queue = queue.Queue()
         self.metadata = None
-        self._table_row = None
+        self._items = {}  # 테이블 컬럼 -> QTableWidgetItem (텍스트만 갱신하기 위해 보관)
+        self.last_size = 0  # 최근 확인한 파일 크기 (UI 타이머가 주기적으로 읽음)
+        self._shown_size = 0  # 테이블에 마지막으로 표시한 크기
+        self._initial_check = True
+        
+        # 녹화 파일 변경 감시 (OS의 파일 변경 알림 사용, 주기적 폴링 없음)
+        self._file_watcher = QFileSystemWatcher(self)
+        self._file_watcher.fileChanged.connect(self._on_file_changed)
+        # 변경 알림은 쓰기마다 발생하므로 알림을 받으면 감시를 잠시 해제하고
+        # 1초 뒤 용량 확인 때 다시 등록 (알림은 최대 1초에 한 번)
+        self._size_timer = QTimer(self)
+        self._size_timer.setSingleShot(True)
+        self._size_timer.setInterval(1000)
+        self._size_timer.timeout.connect(self._check_file_size)
+        # 일정 시간 동안 파일이 커지지 않으면 경고
+        self._stall_timer = QTimer(self)
+        self._stall_timer.setSingleShot(True)
+        self._stall_timer.setInterval(FILE_STALL_TIMEOUT_MS)
+        self._stall_timer.timeout.connect(self._on_file_stalled)
+        
+        # QProcess와 타이머는 GUI 스레드에서 시작해야 하므로 큐 연결로 전달
+        self._metadata_ready.connect(self._start_process, Qt.QueuedConnection)
         
     def get_metadata(self):
         """스트림의 메타데이터를 가져옵니다."""
@@ -53,7 +117,7 @@ class StreamRecorder(QObject):
             result = subprocess.run(cmd, capture_output=True, text=True)
             if result.returncode == 0:
                 try:
-                    metadata = json.loads(result.stdout)
+                    metadata = _json_loads(result.stdout)
                     self.metadata = metadata
                     
                     # 메타데이터를 받은 후 파일명 설정
@@ -65,213 +129,283 @@ class StreamRecorder(QObject):
                     # 파일명 생성
                     filename = f"[{author}] {timestamp} {title}.ts"
                     # 파일명에서 사용할 수 없는 문자 제거
-                    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
+                    filename = _FORBIDDEN_RE.sub('_', filename)
                     self.output_path = os.path.join(self.output_dir, filename)
+                    self._output_path_bytes = os.fsencode(self.output_path)
                     
                     # 파일명 로깅
                     self.log_message.emit(f"녹화 파일명 설정: {filename}")
                     print(f"녹화 파일명 설정: {filename}")
                     
-                    self.metadata_received.emit(metadata)
+                    self.metadata_received.emit(self, metadata)
                     return metadata
                 except json.JSONDecodeError as e:
                     error_msg = f"메타데이터 파싱 실패: {str(e)}"
-                    self.status_changed.emit(self.url, error_msg)
+                    self._emit_status(error_msg)
                     self.log_message.emit(error_msg)
             else:
                 error_msg = f"메타데이터 가져오기 실패: {result.stderr}"
-                self.status_changed.emit(self.url, error_msg)
+                self._emit_status(error_msg)
                 self.log_message.emit(error_msg)
         except Exception as e:
             error_msg = f"메타데이터 오류: {str(e)}"
-            self.status_changed.emit(self.url, error_msg)
+            self._emit_status(error_msg)
             self.log_message.emit(error_msg)
         return None
         
     def start(self):
-        if self.is_running:
+        """녹화를 시작합니다. 메타데이터는 작업 스레드에서 가져오므로 바로 반환합니다."""
+        if self.is_running or self._starting:
             return
             
+        self._starting = True
+        self._stop_requested = False
+        threading.Thread(target=self._fetch_metadata_async, daemon=True).start()
+        
+    def _fetch_metadata_async(self):
         # 먼저 메타데이터 확인
-        if not self.get_metadata():
+        if self.get_metadata():
+            self._metadata_ready.emit()
+        else:
+            self._starting = False
+            
+    @Slot()
+    def _start_process(self):
+        self._starting = False
+        
+        # 메타데이터를 가져오는 동안 중지 요청이 들어온 경우
+        if self._stop_requested:
             return
             
         self.is_running = True
-        self.status_changed.emit(self.url, "시작 중...")
+        self._emit_status("시작 중...")
         
-        # streamlink 명령어 구성
-        cmd = ["streamlink"]
+        # streamlink 인자 구성
+        args = []
         if self.username and self.password:
-            cmd.extend(["--soop-username", self.username, "--soop-password", self.password])
-        cmd.extend([self.url, "best", "-o", self.output_path])
+            args.extend(["--soop-username", self.username, "--soop-password", self.password])
+        args.extend([self.url, "best", "-o", self.output_path])
         
-        try:
-            self.process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True,
-                bufsize=1
-            )
-            
-            # 출력 모니터링 스레드 시작
-            threading.Thread(target=self._monitor_output, daemon=True).start()
-            
-            # 파일 저장 확인 스레드 시작
-            threading.Thread(target=self._check_file_save, daemon=True).start()
-            
-        except Exception as e:
-            self.status_changed.emit(self.url, f"오류: {str(e)}")
+        # 출력은 Qt 이벤트 루프에서 시그널로 받으므로 별도 읽기 스레드가 필요 없음
+        self.process = QProcess(self)
+        self.process.setProcessChannelMode(QProcess.MergedChannels)
+        self.process.readyReadStandardOutput.connect(self._on_stdout)
+        self.process.finished.connect(self._on_finished)
+        self.process.errorOccurred.connect(self._on_process_error)
+        self.process.start("streamlink", args)
+        
+        # 녹화 시작 대기 후 파일 저장 확인 시작
+        QTimer.singleShot(2000, self._check_file_save)
+        
+    def _on_stdout(self):
+        self._feed_output(self.process.readAllStandardOutput().data())
+        
+    def _on_finished(self, exit_code, exit_status):
+        self._on_stdout()
+        self._on_output_closed()
+        
+    def _on_process_error(self, error):
+        # 실행 실패 시에는 finished 시그널이 오지 않음
+        if error == QProcess.FailedToStart and self.is_running:
             self.is_running = False
+            self._emit_status(f"오류: {self.process.errorString()}")
             
     def stop(self):
+        self._stop_requested = True
         if self.process and self.is_running:
-            try:
+            # 종료 중 finished 시그널이 "완료"로 처리되지 않도록 먼저 표시
+            self.is_running = False
+            self._stop_file_watch()
+            
+            if os.name == 'nt':
+                # Windows 콘솔 프로그램은 terminate(WM_CLOSE)를 무시하므로 바로 종료
+                self.process.kill()
+                self.process.waitForFinished()
+            else:
                 # 먼저 정상 종료 시도
                 self.process.terminate()
-                self.process.wait(timeout=5)  # 최대 5초 대기
-            except subprocess.TimeoutExpired:
-                # 정상 종료가 안되면 강제 종료
-                self.process.kill()
-                self.process.wait()
+                if not self.process.waitForFinished(5000):  # 최대 5초 대기
+                    # 정상 종료가 안되면 강제 종료
+                    self.process.kill()
+                    self.process.waitForFinished()
             
-            self.is_running = False
-            self.status_changed.emit(self.url, "중지됨")
+            self._emit_status("중지됨")
             
             # 녹화 파일 최종 확인
-            if os.path.exists(self.output_path):
-                final_size = os.path.getsize(self.output_path)
-                if final_size > 0:
-                    self.log_message.emit(f"녹화 완료: {self.output_path}")
-                    self.log_message.emit(f"최종 파일 크기: {final_size / (1024*1024):.2f}MB")
-                else:
-                    self.log_message.emit("경고: 녹화 파일이 비어있습니다.")
-            else:
+            try:
+                final_size = os.stat(self._output_path_bytes).st_size
+            except FileNotFoundError:
                 self.log_message.emit("경고: 녹화 파일이 생성되지 않았습니다.")
-            
-    def _monitor_output(self):
-        while self.is_running:
-            line = self.process.stdout.readline()
-            if not line and self.process.poll() is not None:
-                break
+                return
                 
-            if line:
-                # 상태 메시지 파싱 및 처리
-                if "error" in line.lower():
-                    self.status_changed.emit(self.url, f"오류: {line.strip()}")
-                elif "stream" in line.lower():
-                    self.status_changed.emit(self.url, line.strip())
-                # 진행률 정보가 있다면 처리
-                if "progress" in line.lower():
-                    self.progress_changed.emit(self.url, line.strip())
+            if final_size > 0:
+                self.log_message.emit(f"녹화 완료: {self.output_path}")
+                self.log_message.emit(f"최종 파일 크기: {format_mb(final_size)}MB")
+            else:
+                self.log_message.emit("경고: 녹화 파일이 비어있습니다.")
+            
+    def _feed_output(self, data):
+        """읽은 출력 조각을 줄 단위로 나누어 처리합니다."""
+        if not self.is_running:
+            return
+            
+        data = (self._output_buffer + data).replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        lines = data.split(b'\n')
+        self._output_buffer = lines.pop()
+        for line in lines:
+            self._process_line(line)
+            
+    def _process_line(self, raw_line):
+        if not raw_line:
+            return
+            
+        # 상태 메시지 파싱 및 처리 (화면에 표시할 줄만 디코딩)
+        lower = raw_line.lower()
+        if lower.find(b"error") != -1:
+            self._emit_status(f"오류: {self._decode_line(raw_line)}")
+        elif lower.find(b"stream") != -1:
+            self._emit_status(self._decode_line(raw_line))
+        # 진행률 정보가 있다면 처리 (값이 바뀐 경우에만 전달)
+        if lower.find(b"progress") != -1:
+            match = _PROGRESS_RE.search(raw_line)
+            if match:
+                percent = int(match.group(1))
+                if percent != self._last_progress:
+                    self._last_progress = percent
+                    self.progress_changed.emit(self.url, percent)
                     
+    def _emit_status(self, status):
+        # 이전과 같은 상태는 시그널을 보내지 않음
+        if status == self._last_status:
+            return
+        self._last_status = status
+        self.status_changed.emit(self.url, status)
+        
+    @staticmethod
+    def _decode_line(raw_line):
+        return raw_line.strip().decode(_OUTPUT_ENCODING, errors='replace')
+            
+    def _on_output_closed(self):
+        if self._output_buffer:
+            self._feed_output(b'\n')
+            
         if self.is_running:
             self.is_running = False
-            self.status_changed.emit(self.url, "완료")
+            self._emit_status("완료")
             
     def _check_file_save(self):
-        """파일이 제대로 저장되는지 확인합니다."""
-        time.sleep(2)  # 녹화 시작 대기
-        
-        if not os.path.exists(self.output_path):
-            self.status_changed.emit(self.url, "경고: 파일이 생성되지 않았습니다.")
-            self.log_message.emit("경고: 녹화 파일이 생성되지 않았습니다.")
+        """파일이 제대로 저장되는지 확인하고 파일 변경 감시를 시작합니다."""
+        if not self.is_running:
             return
             
-        last_size = 0
-        no_growth_count = 0
-        initial_check = True
-        
-        while self.is_running:
-            if not os.path.exists(self.output_path):
-                self.status_changed.emit(self.url, "경고: 파일이 삭제되었습니다.")
-                self.log_message.emit("경고: 녹화 파일이 삭제되었습니다.")
-                break
-                
-            current_size = os.path.getsize(self.output_path)
-            
-            # 초기 파일 생성 확인
-            if initial_check:
-                if current_size > 0:
-                    self.log_message.emit(f"녹화 파일 생성됨: {self.output_path}")
-                    self.log_message.emit(f"초기 파일 크기: {current_size / (1024*1024):.2f}MB")
-                    initial_check = False
-                else:
-                    self.log_message.emit("경고: 파일이 생성되었지만 크기가 0입니다.")
-            
-            if current_size == last_size:
-                no_growth_count += 1
-                if no_growth_count >= 5:  # 5초 동안 파일 크기가 변하지 않으면
-                    self.status_changed.emit(self.url, "경고: 파일이 더 이상 저장되지 않습니다.")
-                    self.log_message.emit("경고: 5초 동안 파일 크기가 증가하지 않았습니다.")
-                    break
-            else:
-                no_growth_count = 0
-            
-            last_size = current_size
-            # 용량 시그널 전송
-            self.size_changed.emit(self.url, current_size)
-            time.sleep(1)
+        # 첫 용량 확인에서 파일 존재 여부도 함께 확인 (감시 등록은 용량 확인에서 처리)
+        if self._check_file_size(first_check=True) is None:
+            return
             
-    def update_status(self, url, status):
-        # 상태 표시 업데이트
-        self.ui.statusLabel.setText(status)
+        self._stall_timer.start()
         
-    def update_progress(self, url, progress):
-        # 진행률 업데이트
-        try:
-            if "progress" in progress.lower():
-                percent = int(re.search(r'(\d+)%', progress).group(1))
-                self.ui.progressBar.setValue(percent)
-        except:
-            pass
+    def _stop_file_watch(self):
+        """파일 변경 감시를 중단합니다."""
+        self._size_timer.stop()
+        self._stall_timer.stop()
+        if self._file_watcher.files():
+            self._file_watcher.removePaths(self._file_watcher.files())
             
-    def update_metadata(self, metadata):
-        """메타데이터를 UI에 표시하고, 테이블의 경로 컬럼을 갱신합니다."""
-        if metadata:
-            stream_metadata = metadata.get('metadata', {})
-            author = stream_metadata.get('author', '알 수 없음')
-            title = stream_metadata.get('title', '알 수 없음')
-            info_text = f"{author} - {title}"
+    def _on_file_changed(self, path):
+        # 다음 용량 확인 전까지는 알림을 받지 않음
+        self._file_watcher.removePath(path)
+        if not self._size_timer.isActive():
+            self._size_timer.start()
             
-            # 메타데이터를 상태 레이블에 표시
-            self.ui.statusLabel.setText(info_text)
+    def _check_file_size(self, first_check=False):
+        """녹화 파일 용량을 확인합니다. 파일이 없으면 None을 반환합니다."""
+        if not self.is_running:
+            # 녹화가 끝난 뒤 남은 알림은 감시 정리만 하고 무시
+            self._stop_file_watch()
+            return None
             
-            # 로그에도 출력
-            self.log(f"스트림 정보: {info_text}")
+        try:
+            current_size = os.stat(self._output_path_bytes).st_size
+        except FileNotFoundError:
+            if first_check:
+                self._emit_status("경고: 파일이 생성되지 않았습니다.")
+                self.log_message.emit("경고: 녹화 파일이 생성되지 않았습니다.")
+            else:
+                self._emit_status("경고: 파일이 삭제되었습니다.")
+                self.log_message.emit("경고: 녹화 파일이 삭제되었습니다.")
+            self._stop_file_watch()
+            return None
+        
+        # 초기 파일 생성 확인
+        if self._initial_check:
+            if current_size > 0:
+                self.log_message.emit(f"녹화 파일 생성됨: {self.output_path}")
+                self.log_message.emit(f"초기 파일 크기: {format_mb(current_size)}MB")
+                self._initial_check = False
+            else:
+                self.log_message.emit("경고: 파일이 생성되었지만 크기가 0입니다.")
+        
+        # 파일이 커졌으면 정지 감지 타이머 재시작
+        if current_size != self.last_size:
+            self._stall_timer.start()
+        
+        # 다음 변경 알림을 받도록 감시 재등록
+        if not self._file_watcher.files():
+            self._file_watcher.addPath(self.output_path)
+        
+        self.last_size = current_size
+        return current_size
+        
+    def _on_file_stalled(self):
+        # 변경 알림을 놓쳤을 수 있으므로 직접 한 번 더 확인
+        last_size = self.last_size
+        current_size = self._check_file_size()
+        if current_size is None or current_size != last_size:
+            return
             
-            # 테이블의 경로 컬럼 갱신
-            # 현재 녹화 중인 url로 recorder를 찾고, row 인덱스도 가져옴
-            url = self.ui.urlInput.text().strip()
-            recorder = self.recorders.get(url)
-            if recorder and hasattr(recorder, '_table_row'):
-                row = recorder._table_row
-                self.ui.recordList.setItem(row, 3, QTableWidgetItem(recorder.output_path))
+        timeout_sec = FILE_STALL_TIMEOUT_MS // 1000
+        self._emit_status("경고: 파일이 더 이상 저장되지 않습니다.")
+        self.log_message.emit(f"경고: {timeout_sec}초 동안 파일 크기가 증가하지 않았습니다.")
+        self._stop_file_watch()
 
 class MainWindow(QMainWindow):
+    _ui_loader = None  # 모든 창이 공유하는 QUiLoader
+    
     def __init__(self):
         super().__init__()
         
-        # UI 파일 로드
-        ui_file_name = "ui/main_window.ui"
-        ui_file = QFile(ui_file_name)
-        if not ui_file.open(QFile.ReadOnly):
-            print(f"Cannot open {ui_file_name}: {ui_file.errorString()}")
+        if MainWindow._ui_loader is None:
+            MainWindow._ui_loader = QUiLoader()
+            
+        # UI 파일 로드 (캐시된 내용을 메모리 버퍼로 읽음)
+        try:
+            ui_bytes = _load_ui_bytes(UI_FILE_NAME)
+        except OSError as e:
+            print(f"Cannot open {UI_FILE_NAME}: {e}")
             sys.exit(-1)
             
-        loader = QUiLoader()
-        self.ui = loader.load(ui_file)
-        ui_file.close()
+        ui_buffer = QBuffer()
+        ui_buffer.setData(QByteArray(ui_bytes))
+        ui_buffer.open(QIODevice.ReadOnly)
+        self.ui = MainWindow._ui_loader.load(ui_buffer)
+        ui_buffer.close()
         
         if not self.ui:
-            print(loader.errorString())
+            print(MainWindow._ui_loader.errorString())
             sys.exit(-1)
             
         # 로그 탭 추가
         self.setup_log_tab()
+        
+        # 마지막으로 사용한 저장 경로 복원
+        self._settings = QSettings("record-gui", "paths")
+        saved_path = self._settings.value("save_path", "")
+        if saved_path and os.path.isdir(saved_path):
+            self.ui.savePathInput.setText(saved_path)
             
         # 녹화 작업 관리
         self.recorders = {}  # url -> StreamRecorder
+        self._size_recorders = []  # 용량 컬럼을 갱신할 recorder 목록 (1초마다 순회)
         
         # UI 이벤트 연결
         self.ui.startButton.clicked.connect(self.start_recording)
@@ -284,6 +418,12 @@ class MainWindow(QMainWindow):
         self.ui.recordList.setColumnCount(6)
         self.ui.recordList.setHorizontalHeaderLabels(["URL", "상태", "시작시간", "경로", "용량", "중지"])
         
+        # 용량 컬럼은 녹화 수와 관계없이 1초에 한 번 일괄 갱신
+        self._size_timer = QTimer(self)
+        self._size_timer.setInterval(1000)
+        self._size_timer.timeout.connect(self.update_sizes)
+        self._size_timer.start()
+        
     def setup_log_tab(self):
         """로그 탭을 설정합니다."""
         # 기존 탭 위젯 찾기
@@ -305,15 +445,45 @@ class MainWindow(QMainWindow):
         log_layout = QVBoxLayout()
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.document().setMaximumBlockCount(LOG_MAX_BLOCKS)
         log_layout.addWidget(self.log_text)
         log_tab.setLayout(log_layout)
         tab_widget.addTab(log_tab, "로그")
         
+        # 로그는 모아 두었다가 100ms마다 한 번에 추가
+        self._log_pending = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(100)
+        self._log_timer.timeout.connect(self.flush_log)
+        self._log_timer.start()
+        
     def log(self, message):
         """로그 메시지를 추가합니다."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
         log_message = f"[{timestamp}] {message}"
-        self.log_text.append(log_message)
+        self._log_pending.append(log_message)
+        
+    def flush_log(self):
+        """쌓인 로그 메시지를 로그 창에 한 번에 추가합니다."""
+        if not self._log_pending:
+            return
+            
+        text = "\n".join(self._log_pending)
+        self._log_pending.clear()
+        
+        # 이미 맨 아래를 보고 있던 경우에만 따라 내려감 (위쪽 로그를 읽는 중이면 유지)
+        scroll_bar = self.log_text.verticalScrollBar()
+        at_bottom = scroll_bar.value() >= scroll_bar.maximum()
+        
+        # 항상 일반 텍스트로 문서 끝에 추가 (append는 HTML로 해석할 수 있음)
+        cursor = QTextCursor(self.log_text.document())
+        cursor.movePosition(QTextCursor.End)
+        if not self.log_text.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertText(text)
+        
+        if at_bottom and self.log_text.isVisible():
+            scroll_bar.setValue(scroll_bar.maximum())
         
     def start_recording(self):
         url = self.ui.urlInput.text().strip()
@@ -328,6 +498,7 @@ class MainWindow(QMainWindow):
             if not save_path:
                 return
             self.ui.savePathInput.setText(save_path)
+        self._settings.setValue("save_path", save_path)
         
         # 로그인 정보 가져오기
         username = self.ui.soopIdInput.text() if self.ui.idPwRadio.isChecked() else None
@@ -339,7 +510,6 @@ class MainWindow(QMainWindow):
         recorder.progress_changed.connect(self.update_progress)
         recorder.metadata_received.connect(self.update_metadata)
         recorder.log_message.connect(self.log)
-        recorder.size_changed.connect(self.update_size)
         
         self.recorders[url] = recorder
         recorder.start()
@@ -351,20 +521,22 @@ class MainWindow(QMainWindow):
         # 테이블에 정보 추가 (URL/상태/시작시간/경로/용량/중지버튼)
         row = self.ui.recordList.rowCount()
         self.ui.recordList.insertRow(row)
-        self.ui.recordList.setItem(row, 0, QTableWidgetItem(url))  # URL
-        self.ui.recordList.setItem(row, 1, QTableWidgetItem("녹화중"))  # 상태
-        self.ui.recordList.setItem(row, 2, QTableWidgetItem(datetime.now().strftime("%Y-%m-%d %H:%M")))  # 시작시간
-        self.ui.recordList.setItem(row, 3, QTableWidgetItem("메타데이터 대기중"))  # 경로(메타데이터 후 갱신)
-        self.ui.recordList.setItem(row, 4, QTableWidgetItem("0 MB"))  # 용량
+        recorder._items = {
+            0: QTableWidgetItem(url),  # URL
+            1: QTableWidgetItem("녹화중"),  # 상태
+            2: QTableWidgetItem(datetime.now().strftime("%Y-%m-%d %H:%M")),  # 시작시간
+            3: QTableWidgetItem("메타데이터 대기중"),  # 경로(메타데이터 후 갱신)
+            4: QTableWidgetItem("0 MB"),  # 용량
+        }
+        for col, item in recorder._items.items():
+            self.ui.recordList.setItem(row, col, item)
+        self._size_recorders.append(recorder)
         stop_btn = QPushButton("중지")
         def stop_this_recording():
             recorder.stop()
-            self.ui.recordList.setItem(row, 1, QTableWidgetItem("중지됨"))  # 상태 컬럼 업데이트
+            recorder._items[1].setText("중지됨")  # 상태 컬럼 업데이트
         stop_btn.clicked.connect(stop_this_recording)
         self.ui.recordList.setCellWidget(row, 5, stop_btn)
-        
-        # row 인덱스를 recorder에 저장해서 메타데이터 후 경로 갱신에 사용
-        recorder._table_row = row
 
     def stop_recording(self):
         url = self.ui.urlInput.text().strip()
@@ -377,16 +549,11 @@ class MainWindow(QMainWindow):
         # 상태 표시 업데이트
         self.ui.statusLabel.setText(status)
         
-    def update_progress(self, url, progress):
+    def update_progress(self, url, percent):
         # 진행률 업데이트
-        try:
-            if "progress" in progress.lower():
-                percent = int(re.search(r'(\d+)%', progress).group(1))
-                self.ui.progressBar.setValue(percent)
-        except:
-            pass
+        self.ui.progressBar.setValue(percent)
             
-    def update_metadata(self, metadata):
+    def update_metadata(self, recorder, metadata):
         """메타데이터를 UI에 표시하고, 테이블의 경로 컬럼을 갱신합니다."""
         if metadata:
             stream_metadata = metadata.get('metadata', {})
@@ -400,21 +567,22 @@ class MainWindow(QMainWindow):
             # 로그에도 출력
             self.log(f"스트림 정보: {info_text}")
             
-            # 테이블의 경로 컬럼 갱신
-            # 현재 녹화 중인 url로 recorder를 찾고, row 인덱스도 가져옴
-            url = self.ui.urlInput.text().strip()
-            recorder = self.recorders.get(url)
-            if recorder and hasattr(recorder, '_table_row'):
-                row = recorder._table_row
-                self.ui.recordList.setItem(row, 3, QTableWidgetItem(recorder.output_path))
+            # 테이블의 경로 컬럼 갱신 (시그널을 보낸 recorder의 행)
+            if recorder._items:
+                recorder._items[3].setText(recorder.output_path)
 
-    def update_size(self, url, size_bytes):
-        # 용량 컬럼 갱신
-        recorder = self.recorders.get(url)
-        if recorder and hasattr(recorder, '_table_row'):
-            row = recorder._table_row
-            size_mb = size_bytes / (1024*1024)
-            self.ui.recordList.setItem(row, 4, QTableWidgetItem(f"{size_mb:.2f} MB"))
+    def update_sizes(self):
+        # 용량 컬럼 갱신 (기존 아이템의 텍스트만 바꿈, 바뀐 셀만 다시 그려짐)
+        active = []
+        for recorder in self._size_recorders:
+            size_bytes = recorder.last_size
+            if size_bytes != recorder._shown_size:
+                recorder._shown_size = size_bytes
+                recorder._items[4].setText(f"{format_mb(size_bytes)} MB")
+            # 끝난 녹화는 마지막 크기를 표시한 뒤 목록에서 제외
+            if recorder.is_running or recorder._starting:
+                active.append(recorder)
+        self._size_recorders = active
 
     def closeEvent(self, event):
         # 모든 녹화 중지